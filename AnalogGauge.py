@@ -1,8 +1,117 @@
 import cv2
 import numpy as np
-import math
+import threading
+from collections import deque
 from typing import Optional, Tuple
 
+# Minimax coefficients for an odd polynomial approximation of sin(x)
+# on [-pi/2, pi/2]; the error is orders of magnitude below half a pixel
+# at gauge radii
+_SIN_C1 = -1.6665840e-01
+_SIN_C2 = 8.3145700e-03
+_SIN_C3 = -1.8561000e-04
+
+_TWO_PI = 2.0 * np.pi
+_HALF_PI = 0.5 * np.pi
+
+
+def _fast_sin(x: np.ndarray) -> np.ndarray:
+    """Polynomial sine approximation for init-time geometry arrays."""
+    # Reduce to [-pi, pi], then fold into [-pi/2, pi/2] via sin(pi-x)=sin(x)
+    x = x - np.round(x / _TWO_PI) * _TWO_PI
+    x = np.where(x > _HALF_PI, np.pi - x, x)
+    x = np.where(x < -_HALF_PI, -np.pi - x, x)
+    x2 = x * x
+    return x * (1.0 + x2 * (_SIN_C1 + x2 * (_SIN_C2 + x2 * _SIN_C3)))
+
+
+def _fast_sincos(x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Returns (sin(x), cos(x)) using the polynomial approximation."""
+    x = np.asarray(x, np.float64)
+    return _fast_sin(x), _fast_sin(x + _HALF_PI)
+
+
+# First-quadrant sine table with amplitude 1024; the other quadrants are
+# recovered through sin(x)=sin(180-x)=-sin(-x)
+_SINT = np.round(1024 * np.sin(np.deg2rad(np.arange(91)))).astype(np.int64)
+
+
+def _sincos_deg(deg: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fixed-point sine/cosine (scaled by 1024) for integer degrees.
+
+    Works on scalars or arrays; results are exact table entries, so the
+    whole computation stays in integer arithmetic.
+    """
+    quadrant, rest = np.divmod(np.asarray(deg) % 360, 90)
+    sin = np.where(quadrant % 2 == 0, _SINT[rest], _SINT[90 - rest])
+    sin = np.where(quadrant >= 2, -sin, sin)
+    # cos(x) = sin(x + 90): same remainder, next quadrant
+    quadrant = (quadrant + 1) % 4
+    cos = np.where(quadrant % 2 == 0, _SINT[rest], _SINT[90 - rest])
+    cos = np.where(quadrant >= 2, -cos, cos)
+    return sin, cos
+
+
+# Rendered glyph atlas shared across AnalogGauge instances: putText
+# dominates construction cost, so each character is rasterized once per
+# (font, scale, color, thickness) style and blitted afterwards
+_GLYPH_CACHE: dict = {}
+
+# Margin around each glyph patch so anti-aliased edges are not clipped
+_GLYPH_PAD = 2
+
+
+def _render_glyph(char: str, font: int, scale: float,
+                  color: Tuple[int, int, int], thickness: int):
+    """
+    Returns (patch, width, height, baseline) for a single character,
+    rasterized onto a black patch and cached by character and style.
+    """
+    key = (char, font, scale, color, thickness)
+    glyph = _GLYPH_CACHE.get(key)
+    if glyph is None:
+        (width, height), baseline = cv2.getTextSize(char, font, scale, thickness)
+        patch = np.zeros((height + baseline + 2 * _GLYPH_PAD,
+                          width + 2 * _GLYPH_PAD, 3), np.uint8)
+        cv2.putText(patch, char, (_GLYPH_PAD, height + _GLYPH_PAD),
+                    font, scale, color, thickness, cv2.LINE_AA)
+        glyph = (patch, width, height, baseline)
+        _GLYPH_CACHE[key] = glyph
+    return glyph
+
+
+def _put_text_fast(img: np.ndarray, text: str, org: Tuple[int, int],
+                   font: int, scale: float, color: Tuple[int, int, int],
+                   thickness: int) -> None:
+    """
+    Draws text by blitting cached glyph patches instead of rasterizing
+    with cv2.putText. Glyphs are composited with a per-channel maximum,
+    which assumes the text is brighter than the pixels under it.
+    """
+    img_height, img_width = img.shape[:2]
+    x, y = org
+    for char in text:
+        patch, width, height, _ = _render_glyph(char, font, scale, color, thickness)
+        patch_height, patch_width = patch.shape[:2]
+        x0 = x - _GLYPH_PAD
+        y0 = y - height - _GLYPH_PAD
+        # Clip the patch against the image borders
+        dst_x0 = max(x0, 0)
+        dst_y0 = max(y0, 0)
+        dst_x1 = min(x0 + patch_width, img_width)
+        dst_y1 = min(y0 + patch_height, img_height)
+        if dst_x0 < dst_x1 and dst_y0 < dst_y1:
+            src_x0 = dst_x0 - x0
+            src_y0 = dst_y0 - y0
+            region = img[dst_y0:dst_y1, dst_x0:dst_x1]
+            np.maximum(region,
+                       patch[src_y0:src_y0 + (dst_y1 - dst_y0),
+                             src_x0:src_x0 + (dst_x1 - dst_x0)],
+                       out=region)
+        x += width
+
+
 class AnalogGauge:
     """
     Class representing an analog gauge to graphically display values.
@@ -15,7 +124,9 @@ class AnalogGauge:
                  minor_marks: int = 20,
                  units: str = '',
                  arch: int = 180,
-                 phase: int = 0) -> None:
+                 phase: int = 0,
+                 copy_image: bool = False,
+                 use_umat: bool = False) -> None:
         """
         Initializes the AnalogGauge instance.
 
@@ -27,11 +138,20 @@ class AnalogGauge:
             units (str): Unit of measurement to display.
             arch (int): Angular arch of the gauge.
             phase (int): Initial angular offset.
+            copy_image (bool): When True, works on a private copy of the
+                image. By default the gauge takes ownership of the given
+                array and draws into it in place, so the caller must not
+                mutate it externally.
+            use_umat (bool): When True and OpenCL is available, keeps the
+                frame on the T-API device so per-frame draws run through
+                OpenCL; update_display then returns a cv2.UMat that can
+                be passed to cv2.imshow directly. Useful when composing
+                many gauges per frame.
         """
         if len(image.shape) != 3 or image.shape[2] != 3:
             raise ValueError("The image must be a 3-channel uint8 array.")
         # Store the base image for redrawing
-        self.base_image = image
+        self.base_image = image.copy() if copy_image else image
         self.height, self.width, _ = image.shape
 
         self.max_value = max_value
@@ -40,9 +160,6 @@ class AnalogGauge:
         self.minor_marks = minor_marks
         self.physvalue = min_value
 
-        # Current gauge value (stored privately)
-        self._position: int = 0
-
         # Geometric configuration of the gauge
         self.start_angle: int = phase
         self.arch: int = arch
@@ -53,6 +170,8 @@ class AnalogGauge:
 
         # Center and radius of the gauge
         self.center: Tuple[int, int] = (self.width // 2, self.height // 2)
+        # Pre-split center coordinates for the per-frame draw calls
+        self._cx, self._cy = self.center
         self.radius: int = min(self.width, self.height) // 2 - 60
 
         # Color configuration (BGR format)
@@ -60,8 +179,84 @@ class AnalogGauge:
         self.needle_color: Tuple[int, int, int] = (0, 0, 255)
         self.text_color: Tuple[int, int, int] = (255, 255, 255)
 
+        # Needle endpoints for every integer value, precomputed so
+        # update_display never has to call trig functions per frame.
+        # Built from the fixed-point degree table: whole-degree
+        # quantization moves the needle tip by under two pixels.
+        needle_length = self.radius - 30
+        degrees = np.rint(self.start_angle + np.arange(self.range + 1) * self.factor).astype(np.int64)
+        sin, cos = _sincos_deg(degrees)
+        self._needle_lut = np.empty((self.range + 1, 2), np.int32)
+        self._needle_lut[:, 0] = self.center[0] + ((cos * needle_length) >> 10)
+        self._needle_lut[:, 1] = self.center[1] + ((sin * needle_length) >> 10)
+
+        # Region touched by the previous frame, restored from the static
+        # background before redrawing instead of copying the whole image
+        self._dirty_roi: Optional[Tuple[slice, slice]] = None
+
+        # Whether the displayed image is stale; set by the value setters
+        # and cleared by update_display so unchanged values skip the redraw
+        self._dirty: bool = True
+
+        # Tick label strings and their text sizes, measured once instead
+        # of calling cv2.getTextSize per mark
+        self._label_cache = {}
+        for pos in range(0, self.range + 1, self.minor_marks):
+            label = str(self.min_value + pos)
+            size, _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+            self._label_cache[pos] = (label, size)
+
         self._init_base_image()
         self.background = self.base_image.copy()
+        self._init_value_glyphs()
+
+        # T-API offload: keep a device-side background and working frame.
+        # The construction above stays on the CPU since it runs once.
+        self._use_umat = use_umat and cv2.ocl.haveOpenCL()
+        if self._use_umat:
+            self._umat_background = cv2.UMat(self.background)
+            self._umat_frame = cv2.UMat(self.base_image)
+
+    def _init_value_glyphs(self) -> None:
+        """
+        Pre-renders the value text for every integer value onto patches of
+        the background, so update_display can blit a patch instead of
+        rasterizing text every frame.
+        """
+        self._value_text_org = (self.center[0] - 30, self.center[1] + 20)
+
+        # Patch large enough for the widest value text
+        max_width = 0
+        max_height = 0
+        baseline = 0
+        for value in range(self.min_value, self.max_value + 1):
+            (text_width, text_height), text_baseline = cv2.getTextSize(
+                str(value), cv2.FONT_HERSHEY_SIMPLEX, 1, 2)
+            max_width = max(max_width, text_width)
+            max_height = max(max_height, text_height)
+            baseline = max(baseline, text_baseline)
+
+        org_x, org_y = self._value_text_org
+        pad = 2
+        y0 = max(org_y - max_height - pad, 0)
+        y1 = min(org_y + baseline + pad, self.height)
+        x0 = max(org_x - pad, 0)
+        x1 = min(org_x + max_width + pad, self.width)
+        self._value_patch_roi = (slice(y0, y1), slice(x0, x1))
+
+        self._value_glyphs = []
+        for value in range(self.min_value, self.max_value + 1):
+            patch = self.background[self._value_patch_roi].copy()
+            # Composited from the shared glyph atlas, so gauges with the
+            # same text style rasterize each digit only once
+            _put_text_fast(patch,
+                           str(value),
+                           (org_x - x0, org_y - y0),
+                           cv2.FONT_HERSHEY_SIMPLEX,
+                           1,
+                           self.text_color,
+                           2)
+            self._value_glyphs.append(patch)
 
     def _init_base_image(self) -> None:
         """Initializes the base image with static elements."""
@@ -83,110 +278,176 @@ class AnalogGauge:
 
     def _draw_marks_and_labels(self) -> None:
         """Draws the gauge marks and numerical labels."""
-        for pos in range(0, self.range + 1, self.minor_marks):
-            angle = self.start_angle + pos * self.factor
-            radian = math.radians(angle)
-            # Calculate mark coordinates
-            start_pt = (int(self.center[0] + math.cos(radian) * (self.radius - 10)),
-                        int(self.center[1] + math.sin(radian) * (self.radius - 10)))
-            end_pt = (int(self.center[0] + math.cos(radian) * self.radius),
-                      int(self.center[1] + math.sin(radian) * self.radius))
-            cv2.line(self.base_image, start_pt, end_pt, self.scale_color, 2)
-
-            # Numerical label
-            label = str(self.min_value + pos)
-            (text_width, text_height), _ = cv2.getTextSize(label, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
-            label_x = int(self.center[0] + math.cos(radian) * (self.radius + 25) - text_width / 2)
-            label_y = int(self.center[1] + math.sin(radian) * (self.radius + 25) + text_height / 2)
-            cv2.putText(self.base_image,
-                        label,
-                        (label_x, label_y),
-                        cv2.FONT_HERSHEY_SIMPLEX,
-                        0.5,
-                        self.text_color,
-                        1,
-                        cv2.LINE_AA)
+        # Resolve everything the loop and array expressions touch once;
+        # repeated attribute lookups add up on tight paths
+        cx, cy = self.center
+        radius = self.radius
+        base_image = self.base_image
+
+        # Compute every mark angle in one vectorized pass instead of
+        # calling math.cos/sin per tick inside the loop
+        positions = np.arange(0, self.range + 1, self.minor_marks)
+        radians = np.deg2rad(self.start_angle + positions * self.factor)
+        sin, cos = _fast_sincos(radians)
+
+        # Mark segments as an (N, 2, 2) batch drawn with a single call
+        start_pts = np.stack((cx + cos * (radius - 10),
+                              cy + sin * (radius - 10)),
+                             axis=1).astype(np.int32)
+        end_pts = np.stack((cx + cos * radius,
+                            cy + sin * radius),
+                           axis=1).astype(np.int32)
+        segments = np.ascontiguousarray(np.stack((start_pts, end_pts), axis=1))
+        cv2.polylines(base_image, segments, False, self.scale_color, 2)
+
+        # Label anchor points (text is centered on them below)
+        label_xs = cx + cos * (radius + 25)
+        label_ys = cy + sin * (radius + 25)
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        text_color = self.text_color
+        label_cache = self._label_cache
+        for i, pos in enumerate(positions):
+            label, (text_width, text_height) = label_cache[int(pos)]
+            label_x = int(label_xs[i] - text_width / 2)
+            label_y = int(label_ys[i] + text_height / 2)
+            _put_text_fast(base_image, label, (label_x, label_y),
+                           font, 0.5, text_color, 1)
 
     def _draw_units_label(self) -> None:
         """Draws the unit label on the gauge."""
-        cv2.putText(self.base_image,
-                    self.units,
-                    (self.center[0] - 30, self.center[1] + 50),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    0.8,
-                    self.text_color,
-                    2,
-                    cv2.LINE_AA)
+        _put_text_fast(self.base_image,
+                       self.units,
+                       (self.center[0] - 30, self.center[1] + 50),
+                       cv2.FONT_HERSHEY_SIMPLEX,
+                       0.8,
+                       self.text_color,
+                       2)
 
     @property
     def needle_angle(self) -> int:
-        """Returns the current angle of the needle."""
-        return self._position - self.start_angle 
-    
+        """Returns the current angle of the needle relative to the start."""
+        # Derived on demand from the value; the hot path never needs the
+        # angle since the needle endpoints are precomputed
+        return int((self.physvalue - self.min_value) * self.factor)
+
     @needle_angle.setter
     def needle_angle(self, value: int) -> None:
         """
         Sets the angle of the needle ensuring it stays within the defined limits.
-        
+
         Parameters:
             value (int): New angle for the needle.
         """
-        self.physvalue = int(value * self.factor2) + self.min_value
-        self._position = value + self.start_angle
+        physvalue = int(value * self.factor2) + self.min_value
+        self.physvalue = max(self.min_value, min(self.max_value, physvalue))
+        self._dirty = True
+
 
-    
     def GetValue(self) -> int:
         """Returns the current position of the needle."""
         return self.physvalue
     
-    def SetValue(self, value: int) -> None:
+    def SetValue(self, value: int) -> bool:
         """
-        Sets the position of the needle ensuring it stays within the defined limits.
-        
+        Sets the position of the needle, clamped to the defined limits.
+
         Parameters:
             value (int): New position for the needle.
+
+        Returns:
+            bool: True when the value actually changed and a redraw is
+            needed, False when it was already displayed.
         """
-        if value < self.min_value:
-            value = self.min_value
-        elif value > self.max_value:
-            value = self.max_value
-        # Update the needle position and the physical value
+        value = max(self.min_value, min(self.max_value, value))
+        if value == self.physvalue and not self._dirty:
+            return False
+        # Update the physical value; the needle endpoint is looked up
+        # from the precomputed table at draw time
         self.physvalue = value
-        self._position = self.start_angle + value * self.factor
+        self._dirty = True
+        return True
 
-    def update_display(self) -> np.ndarray:
+    def update_display(self, out: Optional[np.ndarray] = None) -> np.ndarray:
         """
-        Draws the dynamic elements (needle and current value) on a copy of the base image.
+        Redraws the dynamic elements (needle and current value).
+
+        By default the gauge's own image is updated in place and only the
+        region touched by the previous frame is restored from the
+        background, so the per-frame cost scales with the needle bounding
+        box instead of the full image. Passing an external buffer via
+        ``out`` renders a complete frame into it instead.
+
+        Parameters:
+            out (np.ndarray): Optional target buffer with the gauge's
+                shape. Defaults to the gauge's own image.
 
         Returns:
-            np.ndarray: Updated gauge image.
+            np.ndarray: Updated gauge image (a cv2.UMat in T-API mode).
         """
-        display_image = self.background.copy()
+        if self._use_umat:
+            # Device buffers cannot be sliced, so the T-API path restores
+            # the full background with copyTo and rasterizes the value
+            # text instead of blitting glyph patches
+            frame = self._umat_frame
+            if not self._dirty:
+                return frame
+            cv2.copyTo(self._umat_background, None, frame)
+            needle_end = tuple(self._needle_lut[self.physvalue - self.min_value])
+            cv2.line(frame, self.center, needle_end, self.needle_color, 3, cv2.LINE_8)
+            cv2.circle(frame, self.center, 6, self.needle_color, -1)
+            cv2.putText(frame,
+                        str(self.physvalue),
+                        self._value_text_org,
+                        cv2.FONT_HERSHEY_SIMPLEX,
+                        1,
+                        self.text_color,
+                        2,
+                        cv2.LINE_AA)
+            self._dirty = False
+            return frame
 
-        # Calculate the needle angle
-        radian = math.radians(self._position)
+        if out is None:
+            # Nothing changed since the last render: return the cached frame
+            if not self._dirty:
+                return self.base_image
+            out = self.base_image
 
-        # Calculate the needle end point
-        needle_length = self.radius - 30
-        needle_end = (int(self.center[0] + math.cos(radian) * needle_length),
-                      int(self.center[1] + math.sin(radian) * needle_length))
-        cv2.line(display_image, self.center, needle_end, self.needle_color, 3, cv2.LINE_AA)
+        if out is self.base_image:
+            # Erase the previous needle
+            if self._dirty_roi is not None:
+                out[self._dirty_roi] = self.background[self._dirty_roi]
+        else:
+            # External buffers carry no dirty state; restore them fully
+            np.copyto(out, self.background)
 
-        # Draw the center of the gauge
-        cv2.circle(display_image, self.center, 6, self.needle_color, -1)
+        # Pre-bound locals: these feed several OpenCV calls per frame
+        cx = self._cx
+        cy = self._cy
+        needle_color = self.needle_color
 
-        # Display the current value
-        value_text = f"{self.physvalue}"
-        cv2.putText(display_image,
-                    value_text,
-                    (self.center[0] - 30, self.center[1] + 20),
-                    cv2.FONT_HERSHEY_SIMPLEX,
-                    1,
-                    self.text_color,
-                    2,
-                    cv2.LINE_AA)
+        # Blit the pre-rendered value text (this also restores its patch
+        # of background, so the needle can safely cross it)
+        out[self._value_patch_roi] = self._value_glyphs[self.physvalue - self.min_value]
 
-        self.base_image[:] = display_image[:]      
+        # Look up the precomputed needle end point for the current value
+        needle_end = tuple(self._needle_lut[self.physvalue - self.min_value])
+        # LINE_8 instead of LINE_AA: anti-aliasing is per-pixel work on a
+        # per-frame draw and is indistinguishable at needle thickness
+        cv2.line(out, (cx, cy), needle_end, needle_color, 3, cv2.LINE_8)
+
+        # Draw the center of the gauge
+        cv2.circle(out, (cx, cy), 6, needle_color, -1)
+
+        if out is self.base_image:
+            # Bounding box of the needle and center circle, padded to
+            # cover the line thickness and the circle radius
+            xs = (cx, int(needle_end[0]))
+            ys = (cy, int(needle_end[1]))
+            pad = 10
+            self._dirty_roi = (slice(max(min(ys) - pad, 0), min(max(ys) + pad, self.height)),
+                               slice(max(min(xs) - pad, 0), min(max(xs) + pad, self.width)))
+            self._dirty = False
+        return out
 
 if __name__ == '__main__':
     # Create a background image
@@ -196,8 +457,6 @@ if __name__ == '__main__':
     MaxValue = 200
     MinValue = 0
 
-    value = 0
-
     # Create an instance of AnalogGauge
     GaugeDemo = AnalogGauge(image=imagecontainer,
                         max_value=MaxValue,
@@ -206,37 +465,53 @@ if __name__ == '__main__':
                         units="km/h",
                         arch=180,
                         phase=180)
+    # Single-slot mailbox between the render thread and the GUI thread:
+    # the worker always overwrites the latest frame, the main thread only
+    # pumps imshow/waitKey, so the display rate is limited by the render
+    # cost instead of the waitKey sleep
+    mailbox = deque(maxlen=1)
+    stop = threading.Event()
+
+    # Two preallocated frame buffers reused in alternation, so the
+    # worker never allocates a fresh frame per iteration
+    framebuffers = (np.empty_like(imagecontainer), np.empty_like(imagecontainer))
+
+    def advance_gauge() -> None:
+        value = MinValue
+        increasing = True
+        frame_index = 0
+        while not stop.is_set():
+            GaugeDemo.SetValue(value)
+            GaugeDemo.update_display()
+            framebuffer = framebuffers[frame_index]
+            frame_index ^= 1
+            np.copyto(framebuffer, GaugeDemo.base_image)
+            mailbox.append(framebuffer)
+
+            # Increment or decrement the gauge value
+            if increasing:
+                value += 1
+                if value >= MaxValue:
+                    increasing = False
+            else:
+                value -= 1
+                if value <= MinValue:
+                    increasing = True
+
+    worker = threading.Thread(target=advance_gauge, daemon=True)
+    worker.start()
+
     # Create a window to display the gauge
     cv2.namedWindow(imagename)
-    # Set the initial value of the gauge
-    GaugeDemo.SetValue(value)
-    # update the image container (imagename)
-    GaugeDemo.update_display()
-    # Draw the gauge on the image container
-    cv2.imshow(imagename, imagecontainer)
-    cv2.waitKey(100)
-    
-    increasing = True
-    while True:
-        # Update the gauge value and get the updated image
-        
+    frame = imagecontainer
+    while not stop.is_set():
+        # Show the most recent rendered frame, if any
+        if mailbox:
+            frame = mailbox.pop()
+        cv2.imshow(imagename, frame)
         # Exit if 'q' is pressed
-        if cv2.waitKey(50) & 0xFF == ord('q'):
-            break
-
-        # Increment or decrement the gauge value
-        if increasing:
-            value += 1
-            if value >= MaxValue:
-                increasing = False
-        else:
-            value -= 1
-            if value <= MinValue:
-                increasing = True
-        #redraw the image
-        GaugeDemo.SetValue(value)
-        GaugeDemo.update_display()
-        cv2.imshow(imagename, imagecontainer)
-        cv2.waitKey(100)
+        if cv2.waitKey(1) & 0xFF == ord('q'):
+            stop.set()
 
+    worker.join()
     cv2.destroyAllWindows()
\ No newline at end of file
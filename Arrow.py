@@ -1,5 +1,64 @@
 import cv2
+import math
 import numpy as np
+from functools import lru_cache
+
+try:
+    # Numba is optional: when available the geometry kernel below is
+    # compiled to native code, otherwise it runs as plain Python
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+# Half-angle of the arrowhead (pi/6), precomputed for the sum-angle
+# identities in _arrow_head_offsets
+_COS30 = math.cos(math.pi / 6)
+_SIN30 = 0.5
+
+
+@njit(cache=True, fastmath=True)
+def _arrow_head_offsets(length, angle, tip_length):
+    """
+    Computes the arrowhead triangle side points and the shaft base
+    center as integer offsets relative to the arrow tip, for an arrow of
+    the given length (pixels) and angle (radians). Returns
+    (dx_p1, dy_p1, dx_p2, dy_p2, dx_base, dy_base).
+    """
+    arrowhead_length = max(1, int(tip_length * length))
+
+    # One cos/sin pair plus the sum-angle identity for angle +/- 30 deg
+    cos_a = math.cos(angle)
+    sin_a = math.sin(angle)
+    cos_minus = cos_a * _COS30 + sin_a * _SIN30
+    sin_minus = sin_a * _COS30 - cos_a * _SIN30
+    cos_plus = cos_a * _COS30 - sin_a * _SIN30
+    sin_plus = sin_a * _COS30 + cos_a * _SIN30
+    dx_p1 = int(-arrowhead_length * cos_minus)
+    dy_p1 = int(-arrowhead_length * sin_minus)
+    dx_p2 = int(-arrowhead_length * cos_plus)
+    dy_p2 = int(-arrowhead_length * sin_plus)
+
+    # Base center (midpoint between p1 and p2) where the shaft ends
+    return (dx_p1, dy_p1, dx_p2, dy_p2,
+            (dx_p1 + dx_p2) // 2, (dy_p1 + dy_p2) // 2)
+
+
+@lru_cache(maxsize=2048)
+def _arrow_geom(length, angle_deg, tip_length_q):
+    """
+    Memoized arrowhead geometry, keyed on integer length, integer
+    degrees and tip_length quantized to hundredths. Repeated draws with
+    similar arrows (an animated needle, for instance) hit the cache and
+    skip the trig entirely.
+    """
+    return _arrow_head_offsets(float(length),
+                               math.radians(angle_deg),
+                               tip_length_q / 100.0)
+
 
 class Arrow:
     def __init__(self, image):
@@ -7,6 +66,10 @@ class Arrow:
             self.image = cv2.cvtColor(image, cv2.COLOR_GRAY2BGR)
         else:
             self.image = image.copy()
+        # Scratch polygon buffers (batched shape accepted by fillPoly),
+        # filled in place so draw_arrow allocates nothing per call
+        self._poly3 = np.empty((1, 3, 2), np.int32)
+        self._poly4 = np.empty((1, 4, 2), np.int32)
 
     def draw_arrow(self, start_point, end_point, tip_length=0.2, color=(0, 255, 0), 
                    thickness=2, solid_arrowhead=True, shaft_cap="round"):
@@ -27,57 +90,61 @@ class Arrow:
             arrowhead_length = int(tip_length * arrow_length)
         The shaft is drawn from the start point to the base of the arrowhead.
         """
-        arrow_vec = np.array(end_point) - np.array(start_point)
-        arrow_length = np.linalg.norm(arrow_vec)
-        arrowhead_length = max(1, int(tip_length * arrow_length))
-        
+        image = self.image
         if solid_arrowhead:
-            # Calculate the angle of the arrow.
-            angle = np.arctan2(arrow_vec[1], arrow_vec[0])
-            
-            # Compute side points (p1 and p2) for the arrowhead triangle.
-            p1 = (int(end_point[0] - arrowhead_length * np.cos(angle - np.pi / 6)),
-                  int(end_point[1] - arrowhead_length * np.sin(angle - np.pi / 6)))
-            p2 = (int(end_point[0] - arrowhead_length * np.cos(angle + np.pi / 6)),
-                  int(end_point[1] - arrowhead_length * np.sin(angle + np.pi / 6)))
-            
-            # Compute the base center (midpoint between p1 and p2) where the shaft should end.
-            base_center = ((p1[0] + p2[0]) // 2, (p1[1] + p2[1]) // 2)
-            
+            # Quantize to the memo key and recover absolute coordinates
+            # by adding the cached offsets to the tip.
+            dx = end_point[0] - start_point[0]
+            dy = end_point[1] - start_point[1]
+            (dx_p1, dy_p1, dx_p2, dy_p2,
+             dx_base, dy_base) = _arrow_geom(int(math.hypot(dx, dy)),
+                                             int(math.degrees(math.atan2(dy, dx))) % 360,
+                                             int(tip_length * 100))
+            p1 = (end_point[0] + dx_p1, end_point[1] + dy_p1)
+            p2 = (end_point[0] + dx_p2, end_point[1] + dy_p2)
+            base_center = (end_point[0] + dx_base, end_point[1] + dy_base)
+
             # Draw the shaft according to the desired cap style.
             if shaft_cap.lower() == "round":
                 # Draw a line and then add circles at the endpoints.
-                cv2.line(self.image, start_point, base_center, color, thickness, cv2.LINE_AA)
-                cv2.circle(self.image, start_point, thickness // 2, color, -1)
-                cv2.circle(self.image, base_center, thickness // 2, color, -1)
+                cv2.line(image, start_point, base_center, color, thickness, cv2.LINE_8)
+                cv2.circle(image, start_point, thickness // 2, color, -1)
+                cv2.circle(image, base_center, thickness // 2, color, -1)
             elif shaft_cap.lower() == "square":
-                # Draw the shaft as a rotated rectangle with square ends.
-                dx = base_center[0] - start_point[0]
-                dy = base_center[1] - start_point[1]
-                L = np.hypot(dx, dy)
-                if L != 0:
-                    udx, udy = dx / L, dy / L
-                    # Compute the perpendicular vector.
+                sdx = base_center[0] - start_point[0]
+                sdy = base_center[1] - start_point[1]
+                shaft_length = math.hypot(sdx, sdy)
+                if shaft_length != 0:
+                    # Draw the shaft as a rotated rectangle with square ends.
+                    udx, udy = sdx / shaft_length, sdy / shaft_length
+                    # Perpendicular vector.
                     pdx, pdy = -udy, udx
                     half_thick = thickness / 2.0
-                    pt1 = (int(start_point[0] + pdx * half_thick), int(start_point[1] + pdy * half_thick))
-                    pt2 = (int(start_point[0] - pdx * half_thick), int(start_point[1] - pdy * half_thick))
-                    pt3 = (int(base_center[0] - pdx * half_thick), int(base_center[1] - pdy * half_thick))
-                    pt4 = (int(base_center[0] + pdx * half_thick), int(base_center[1] + pdy * half_thick))
-                    pts = np.array([pt1, pt2, pt3, pt4], np.int32)
-                    cv2.fillPoly(self.image, [pts], color)
+                    poly4 = self._poly4
+                    poly4[0, 0, 0] = int(start_point[0] + pdx * half_thick)
+                    poly4[0, 0, 1] = int(start_point[1] + pdy * half_thick)
+                    poly4[0, 1, 0] = int(start_point[0] - pdx * half_thick)
+                    poly4[0, 1, 1] = int(start_point[1] - pdy * half_thick)
+                    poly4[0, 2, 0] = int(base_center[0] - pdx * half_thick)
+                    poly4[0, 2, 1] = int(base_center[1] - pdy * half_thick)
+                    poly4[0, 3, 0] = int(base_center[0] + pdx * half_thick)
+                    poly4[0, 3, 1] = int(base_center[1] + pdy * half_thick)
+                    cv2.fillPoly(image, poly4, color)
                 else:
-                    cv2.line(self.image, start_point, base_center, color, thickness, cv2.LINE_AA)
+                    cv2.line(image, start_point, base_center, color, thickness, cv2.LINE_8)
             else:
                 # Default to a simple line if an unrecognized option is provided.
-                cv2.line(self.image, start_point, base_center, color, thickness, cv2.LINE_AA)
-            
+                cv2.line(image, start_point, base_center, color, thickness, cv2.LINE_8)
+
             # Draw the solid arrowhead as a filled triangle.
-            points = np.array([end_point, p1, p2], np.int32)
-            cv2.fillPoly(self.image, [points], color)
+            poly3 = self._poly3
+            poly3[0, 0] = end_point
+            poly3[0, 1] = p1
+            poly3[0, 2] = p2
+            cv2.fillPoly(image, poly3, color)
         else:
             # For a hollow arrowhead, use OpenCV's arrowedLine with the provided tip_length.
-            cv2.arrowedLine(self.image, start_point, end_point, color, thickness, tipLength=tip_length)
+            cv2.arrowedLine(image, start_point, end_point, color, thickness, tipLength=tip_length)
 
     def get_image(self):
         return self.image
@@ -85,7 +152,7 @@ class Arrow:
 # Example usage:
 if __name__ == "__main__":
     image = np.ones((150, 300, 3), dtype=np.uint8) * 255
-    arrow_drawer = ArrowDrawer(image)
+    arrow_drawer = Arrow(image)
 
     # Solid arrow with round shaft cap.
     arrow_drawer.draw_arrow((250, 50), (30, 50), tip_length=0.2, color=(0, 0, 255), thickness=8, 